@@ -524,6 +524,10 @@ class ShapeKeyOps(CollectionPropBase[ShapeKeyOp]):
 
 
 def object_build_settings_update_name(self: 'ObjectBuildSettings', context: Context):
+    new_name = self.name_prop
+    if not new_name or new_name == self.name:
+        # update_name_ensure_unique won't change anything, so skip getting the names from every scene
+        return
     # id_data is the ID that owns this which should be the object
     obj = self.id_data
     object_group = ObjectPropertyGroup.get_group(obj)
@@ -1001,7 +1005,7 @@ class ObjectPropertyGroup(IdPropertyGroup, CollectionPropBase[ObjectBuildSetting
 
     # Technically, we can't limit which Object types receive the PropertyGroup, but operators and other code can check
     # against the allowed types and skip Objects that don't have a correct type
-    ALLOWED_TYPES = {'ARMATURE', 'MESH'}
+    ALLOWED_TYPES = frozenset({'ARMATURE', 'MESH'})
 
     collection: CollectionProperty(type=ObjectBuildSettings)
 
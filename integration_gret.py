@@ -14,13 +14,16 @@ def check_gret_shape_key_apply_modifiers() -> Union[str, Literal[False], None]:
     """When valid, returns a truthy string that also indicates version.
      When not detected, returns None.
      When detected, but the version could not be determined, returns False."""
-    if utils.operator_exists(_apply_modifiers_op):
-        for prop in _apply_modifiers_op.get_rna_type().properties:
-            identifier = prop.identifier
-            if identifier == 'modifier_mask' or identifier == 'keep_modifiers':
-                return identifier
-        return False
-    return None
+    # This is called when drawing the Object panel, so rather than using utils.operator_exists and then getting the rna
+    # type again, get it once and look up the properties by identifier instead of iterating them all
+    try:
+        properties = _apply_modifiers_op.get_rna_type().properties
+    except KeyError:
+        return None
+    for identifier in ('modifier_mask', 'keep_modifiers'):
+        if identifier in properties:
+            return identifier
+    return False
 
 
 def _run_gret_shape_key_apply_modifiers_keep_modifiers(obj: Object, modifier_names_to_apply: set[str]) -> set[str]:
@@ -1,9 +1,39 @@
-from bpy.types import Context, SpaceProperties, Object, SpaceView3D, UILayout
+from bpy.types import Context, SpaceProperties, Object, SpaceView3D, UILayout, bpy_struct
+
+from contextlib import contextmanager
+from typing import Generic, Optional, TypeVar, Iterator
 
 from .extensions import ObjectPropertyGroup
 from .utils import PropertyHolderType
 
 
+T = TypeVar('T')
+
+
+class UIListDrawData(Generic[T]):
+    """Data that is the same for every row of a UI list, stored by the pointer of the list's data.
+    A UI list draws its rows while template_list is being called, so a Panel can look the data up once and store it only
+    for the duration of the call, instead of every row looking it up again."""
+    def __init__(self):
+        self._data: dict[int, T] = {}
+
+    @contextmanager
+    def drawing(self, data: bpy_struct, draw_data: T) -> Iterator[None]:
+        """Store draw_data for the UI list of data while the context is active, template_list should be called
+        within"""
+        data_pointer = data.as_pointer()
+        self._data[data_pointer] = draw_data
+        try:
+            yield
+        finally:
+            del self._data[data_pointer]
+
+    def get(self, data: bpy_struct) -> Optional[T]:
+        """Get the stored data for the UI list of data, returns None when the list isn't being drawn within
+        drawing(), in which case the data should be looked up directly"""
+        return self._data.get(data.as_pointer())
+
+
 def draw_expandable_header(layout: UILayout, ui_toggle_data: PropertyHolderType, ui_toggle_prop: str,
                            alert: bool = False, **header_args):
     header_row = layout.row(align=True)
@@ -17,9 +47,9 @@ def draw_expandable_header(layout: UILayout, ui_toggle_data: PropertyHolderType,
     # contents.
     # To debug the clickable regions of the header, set emboss to True in each .prop call and the header_args.
 
-    # Force emboss to be disabled
-    header_args['emboss'] = False
-    if header_args.get('icon', 'NONE') != 'NONE':
+    # 'NONE' means there is no extra icon, in which case the 'expand_icon' is used as the icon instead
+    icon = header_args.pop('icon', 'NONE')
+    if icon != 'NONE':
 
         # Since we have an extra icon to draw, we need to draw an extra prop for the 'expand_icon' only
         header_row.prop(ui_toggle_data, ui_toggle_prop, text="", icon=expand_icon, emboss=False)
@@ -29,11 +59,11 @@ def draw_expandable_header(layout: UILayout, ui_toggle_data: PropertyHolderType,
         # the header text there
         sub_row = header_row.row(align=True)
         sub_row.alignment = 'LEFT'
-        sub_row.prop(ui_toggle_data, ui_toggle_prop, **header_args)
+        sub_row.prop(ui_toggle_data, ui_toggle_prop, icon=icon, emboss=False, **header_args)
     else:
         sub_row = header_row.row(align=True)
         sub_row.alignment = 'LEFT'
-        sub_row.prop(ui_toggle_data, ui_toggle_prop, icon=expand_icon, **header_args)
+        sub_row.prop(ui_toggle_data, ui_toggle_prop, icon=expand_icon, emboss=False, **header_args)
 
     # We then need a third element to expand and fill the rest of the header, ensuring that the entire header can be
     # clicked on.
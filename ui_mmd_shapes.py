@@ -1,9 +1,11 @@
-from bpy.types import Panel, UIList, Context, UILayout, Mesh, Menu, OperatorProperties, UIPopover
+from bpy.types import Panel, UIList, Context, UILayout, Mesh, Menu, OperatorProperties, UIPopover, Key
 from bpy.props import EnumProperty, IntProperty, BoolProperty
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 
 import os
-from typing import Generator, Union, cast, NamedTuple
+from itertools import islice
+from operator import attrgetter
+from typing import NamedTuple, Optional, Iterable, Iterator
 import csv
 
 from . import integration_cats
@@ -16,6 +18,12 @@ from .context_collection_ops import (
 from .version_compatibility import OPERATORS_HAVE_POLL_MESSAGES
 from .integration_cats import draw_cats_download
 from .tools.apply_mmd_mappings import ApplyMMDMappings
+from .ui_common import UIListDrawData
+
+
+def _get_mapping_group(context: Context) -> MmdShapeMappingGroup:
+    """Get the MMD shape mapping group of the context's scene"""
+    return ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group
 
 
 class ShowMappingComment(OperatorBase):
@@ -44,7 +52,7 @@ class ShowMappingComment(OperatorBase):
 
     @staticmethod
     def get_mapping(use_active: bool, index: int, context: Context):
-        shape_mapping_group = ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group
+        shape_mapping_group = _get_mapping_group(context)
         if use_active:
             return shape_mapping_group.active
         data = shape_mapping_group.collection
@@ -61,18 +69,19 @@ class ShowMappingComment(OperatorBase):
         index = properties.index
         mapping = cls.get_mapping(use_active, index, context)
         if mapping:
-            comment = mapping.comment
             # noinspection PyUnresolvedReferences
-            is_menu = properties.is_menu
-            if is_menu or not comment:
-                mmd_name = mapping.mmd_name
-                if mmd_name:
-                    return f"Edit comment for {mmd_name}"
-                else:
-                    return (f"Edit the comment of the active mapping. If a mapping consists of only a comment, the"
-                            f" comment will be displayed across every column")
+            if not properties.is_menu:
+                # Most commonly, the description is for the comment icon of a mapping in the UI list, in which case the
+                # comment itself is shown and nothing else needs to be read
+                comment = mapping.comment
+                if comment:
+                    return comment
+            mmd_name = mapping.mmd_name
+            if mmd_name:
+                return f"Edit comment for {mmd_name}"
             else:
-                return comment
+                return ("Edit the comment of the active mapping. If a mapping consists of only a comment, the comment"
+                        " will be displayed across every column")
         else:
             if use_active:
                 return "ERROR: active mapping not found"
@@ -88,9 +97,15 @@ class ShowMappingComment(OperatorBase):
                 # update fixes it
                 layout.activate_init = True
                 layout.prop(mapping, 'comment', text="")
-            # Roughly expands to fit the comment with some extra space for additional typing
-            # These are purely magic numbers
-            ui_units_x = min(max(10, len(mapping.comment) // 2), 40)
+            # Roughly expands to fit the comment with some extra space for additional typing, clamped to between 10 and
+            # 40. These are purely magic numbers
+            comment_length = len(mapping.comment)
+            if comment_length < 20:
+                ui_units_x = 10
+            elif comment_length > 80:
+                ui_units_x = 40
+            else:
+                ui_units_x = comment_length // 2
             # Draw popup window that lets the user edit the comment
             context.window_manager.popover(draw_popover, ui_units_x=ui_units_x, from_active_button=True)
         else:
@@ -101,22 +116,54 @@ class ShowMappingComment(OperatorBase):
         return {'FINISHED'}
 
 
+def _get_linked_shape_keys(group: MmdShapeMappingGroup) -> Optional[Key]:
+    """Get the shape keys of the Search Mesh linked to the group, if there is a linked Search Mesh and it has shape
+    keys"""
+    linked_obj = group.linked_mesh_object
+    if linked_obj:
+        linked_mesh = linked_obj.data
+        if isinstance(linked_mesh, Mesh):
+            shape_keys = linked_mesh.shape_keys
+            if shape_keys:
+                return shape_keys
+    return None
+
+
+class _ListDrawData(NamedTuple):
+    """Data that is the same for every row of a UI list of MmdShapeMappings"""
+    # Shape keys of the linked Search Mesh
+    shape_keys: Optional[Key]
+    # Whether the Cats addon exists, the translate buttons can't do anything without it
+    cats_exists: bool
+    # Path from context to the group's collection, used by the translate buttons
+    collection_data_path: str
+
+    @staticmethod
+    def from_group(group: MmdShapeMappingGroup) -> '_ListDrawData':
+        return _ListDrawData(_get_linked_shape_keys(group), integration_cats.cats_exists(),
+                             'scene.' + group.path_from_id('collection'))
+
+
+# MmdShapeMappingsPanel.draw stores the _ListDrawData of the group it draws so that the data only gets looked up once
+# per redraw instead of once for every row.
+_list_draw_data: UIListDrawData[_ListDrawData] = UIListDrawData()
+
+
 class MmdMappingList(UIList):
     bl_idname = "mmd_shapes"
 
     def draw_item(self, context: Context, layout: UILayout, data: MmdShapeMappingGroup, item: MmdShapeMapping,
                   icon: int, active_data: MmdShapeMappingGroup, active_property: str, index: int = 0,
                   flt_flag: int = 0):
-        shape_keys = None
-        linked_obj = data.linked_mesh_object
-        if linked_obj:
-            linked_mesh = linked_obj.data
-            if isinstance(linked_mesh, Mesh):
-                temp_shape_keys = linked_mesh.shape_keys
-                if temp_shape_keys:
-                    shape_keys = temp_shape_keys
+        list_draw_data = _list_draw_data.get(data)
+        if list_draw_data is None:
+            # Not being drawn from MmdShapeMappingsPanel, so look up the data directly
+            list_draw_data = _ListDrawData.from_group(data)
+        shape_keys, cats_exists, collection_path = list_draw_data
         comment = item.comment
-        if not item.mmd_name and not item.model_shape and not item.cats_translation_name and comment:
+        mmd_name = item.mmd_name
+        # Most mappings don't have a comment, so check the comment first to avoid reading the other properties
+        if comment and not mmd_name and not item.model_shape and not item.cats_translation_name:
             # We only have a comment, so only draw the comment
             layout.prop(item, 'comment', emboss=False, text="", icon='INFO')
             # The row ends up a slightly different height to non-comment rows if we don't put something in a column_flow
@@ -138,7 +185,6 @@ class MmdMappingList(UIList):
                 column_flow.prop(item, 'model_shape', text="")
 
             # Second column for the MMD name plus optional comment
-            comment = item.comment
             if comment:
                 mmd_row = column_flow.row(align=True)
                 mmd_row.prop(item, 'mmd_name', text="")
@@ -151,28 +197,45 @@ class MmdMappingList(UIList):
             # Third column for the Cats translation
             cats_row = column_flow.row(align=True)
             cats_row.prop(item, 'cats_translation_name', text="", emboss=False)
-            op_row = cats_row.row(align=True)
-            op_row.enabled = bool(item.mmd_name)
-            translate_options = op_row.operator(integration_cats.CatsTranslate.bl_idname, text="", icon='WORLD_DATA')
-            translate_options.to_translate = item.mmd_name
-            translate_options.is_shape_key = True
-            # Path from context to the property
-            translate_options.data_path = 'scene.' + item.path_from_id('cats_translation_name')
-            translate_options.custom_description = "Translate the MMD shape key"
+            if mmd_name and cats_exists:
+                translate_options = cats_row.operator(integration_cats.CatsTranslate.bl_idname, text="",
+                                                      icon='WORLD_DATA')
+                translate_options.to_translate = mmd_name
+                translate_options.is_shape_key = True
+                # Path from context to the property
+                translate_options.data_path = f'{collection_path}[{index}].cats_translation_name'
+                translate_options.custom_description = "Translate the MMD shape key"
+            elif mmd_name:
+                # Cats isn't available, so the operator's poll will disable the button and its tooltip will explain
+                # why. The button can't do anything, so its properties, including the data path, aren't set.
+                cats_row.operator(integration_cats.CatsTranslate.bl_idname, text="", icon='WORLD_DATA')
+            else:
+                # There's nothing to translate, so draw the button disabled and skip setting its properties.
+                # A sub-row is needed so that only the button is disabled and not the translation property too.
+                op_row = cats_row.row(align=True)
+                op_row.enabled = False
+                op_row.operator(integration_cats.CatsTranslate.bl_idname, text="", icon='WORLD_DATA')
 
 
 class MmdMappingControlBase(ContextCollectionOperatorBase):
     @classmethod
     def get_collection(cls, context: Context) -> PropCollectionType:
-        return ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.collection
+        return _get_mapping_group(context).collection
 
     @classmethod
     def get_active_index(cls, context: Context) -> int:
-        return ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.active_index
+        return _get_mapping_group(context).active_index
 
     @classmethod
     def set_active_index(cls, context: Context, value: int):
-        ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.active_index = value
+        _get_mapping_group(context).active_index = value
+
+    @classmethod
+    def active_index_in_bounds(cls, context: Context):
+        # Overridden to get both the collection and the active index from a single group lookup. This gets called by
+        # the poll functions of the Remove and Move operators every time their buttons are drawn.
+        group = _get_mapping_group(context)
+        return cls.index_in_bounds(group.collection, group.active_index)
 
 
 _op_builder = MmdMappingControlBase.op_builder(
@@ -192,10 +255,18 @@ class MmdMappingsClearShapeNames(MmdMappingControlBase, OperatorBase):
     def execute(self, context: Context) -> set[str]:
         mapping: MmdShapeMapping
         for mapping in self.get_collection(context):
-            mapping.model_shape = ''
+            # Setting model_shape runs its update function, so skip mappings that are already cleared
+            if mapping.model_shape:
+                mapping.model_shape = ''
         return {'FINISHED'}
 
 
+def _get_existing_values(mappings: Iterable[MmdShapeMapping], prop_name: str) -> frozenset[str]:
+    """Get the values of the prop_name property of each mapping, for checking if a mapping with a specific value already
+    exists"""
+    return frozenset(getattr(mapping, prop_name) for mapping in mappings)
+
+
 class MmdMappingsAddFromSearchMesh(MmdMappingControlBase, OperatorBase):
     """Load Shape Keys from Search Mesh. Will not add mappings that already exist"""
     bl_idname = 'mmd_shape_mappings_add_from_search_mesh'
@@ -204,18 +275,18 @@ class MmdMappingsAddFromSearchMesh(MmdMappingControlBase, OperatorBase):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        return ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.linked_mesh_object is not None
+        return _get_mapping_group(context).linked_mesh_object is not None
 
     def execute(self, context: Context) -> set[str]:
-        data = self.get_collection(context)
-        mapping: MmdShapeMapping
-        existing_mappings = {mapping.model_shape for mapping in data}
-        me = cast(Mesh, ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.linked_mesh_object.data)
-        shape_keys = me.shape_keys
+        group = _get_mapping_group(context)
+        data = group.collection
+        existing_mappings = _get_existing_values(data, 'model_shape')
+        shape_keys = _get_linked_shape_keys(group)
         if shape_keys:
+            # Getting all the names with .keys() is a single call, rather than accessing .name of each shape key
+            shape_key_names = shape_keys.key_blocks.keys()
             # Skip the first shape key, the reference ('basis') key
-            for key in shape_keys.key_blocks[1:]:
-                shape_key_name = key.name
+            for shape_key_name in islice(shape_key_names, 1, None):
                 if shape_key_name not in existing_mappings:
                     mapping = data.add()
                     mapping.model_shape = shape_key_name
@@ -231,18 +302,18 @@ class MmdMappingsAddMmdFromSearchMesh(MmdMappingControlBase, OperatorBase):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        return ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.linked_mesh_object is not None
+        return _get_mapping_group(context).linked_mesh_object is not None
 
     def execute(self, context: Context) -> set[str]:
-        data = self.get_collection(context)
-        mapping: MmdShapeMapping
-        existing_mappings = {mapping.mmd_name for mapping in data}
-        me = cast(Mesh, ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.linked_mesh_object.data)
-        shape_keys = me.shape_keys
+        group = _get_mapping_group(context)
+        data = group.collection
+        existing_mappings = _get_existing_values(data, 'mmd_name')
+        shape_keys = _get_linked_shape_keys(group)
         if shape_keys:
+            # Getting all the names with .keys() is a single call, rather than accessing .name of each shape key
+            shape_key_names = shape_keys.key_blocks.keys()
             # Skip the first shape key, the reference ('basis') key
-            for key in shape_keys.key_blocks[1:]:
-                shape_key_name = key.name
+            for shape_key_name in islice(shape_key_names, 1, None):
                 if shape_key_name not in existing_mappings:
                     mapping = data.add()
                     mapping.mmd_name = shape_key_name
@@ -253,12 +324,20 @@ class MmdShapesAddMenu(Menu):
     bl_idname = "mmd_shape_mapping_add"
     bl_label = "Add"
 
+    # (position, text, icon) of each add operator in the menu
+    _ADD_ITEMS = (
+        ('TOP', "Top", 'TRIA_UP_BAR'),
+        ('BEFORE', "Before Active", 'TRIA_UP'),
+        ('AFTER', "After Active", 'TRIA_DOWN'),
+        ('BOTTOM', "Bottom", 'TRIA_DOWN_BAR'),
+    )
+
     def draw(self, context: Context):
         layout = self.layout
-        layout.operator(MmdMappingAdd.bl_idname, text="Top", icon='TRIA_UP_BAR').position = 'TOP'
-        layout.operator(MmdMappingAdd.bl_idname, text="Before Active", icon='TRIA_UP').position = 'BEFORE'
-        layout.operator(MmdMappingAdd.bl_idname, text="After Active", icon='TRIA_DOWN').position = 'AFTER'
-        layout.operator(MmdMappingAdd.bl_idname, text="Bottom", icon='TRIA_DOWN_BAR').position = 'BOTTOM'
+        # bl_idname is prefixed when registering, so it must not be looked up in advance
+        add_idname = MmdMappingAdd.bl_idname
+        for position, text, icon in MmdShapesAddMenu._ADD_ITEMS:
+            layout.operator(add_idname, text=text, icon=icon).position = position
 
 
 class MmdShapesSpecialsMenu(Menu):
@@ -278,8 +357,9 @@ class MmdShapesSpecialsMenu(Menu):
         options.use_active = True
         options.is_menu = True
         layout.separator()
-        layout.operator(MmdMappingMove.bl_idname, text="Move To Top", icon="TRIA_UP_BAR").type = 'TOP'
-        layout.operator(MmdMappingMove.bl_idname, text="Move To Bottom", icon="TRIA_DOWN_BAR").type = 'BOTTOM'
+        move_idname = MmdMappingMove.bl_idname
+        layout.operator(move_idname, text="Move To Top", icon="TRIA_UP_BAR").type = 'TOP'
+        layout.operator(move_idname, text="Move To Bottom", icon="TRIA_DOWN_BAR").type = 'BOTTOM'
         layout.separator()
         layout.operator(ApplyMMDMappings.bl_idname, text="Apply To Selected", icon="CHECKMARK")
 
@@ -295,14 +375,9 @@ class MappingCsvLine(NamedTuple):
     def is_only_comment(self):
         return self.comment and not self.model_shape and not self.mmd_name and not self.cats_translation
 
-    @classmethod
-    def from_mapping(cls, mapping: MmdShapeMapping):
-        return cls(
-            model_shape=mapping.model_shape,
-            mmd_name=mapping.mmd_name,
-            cats_translation=mapping.cats_translation_name,
-            comment=mapping.comment,
-        )
+
+# 1 MiB
+_CSV_WRITE_BUFFER_SIZE = 1024 * 1024
 
 
 class ExportShapeSettings(OperatorBase, ExportHelper):
@@ -314,13 +389,19 @@ class ExportShapeSettings(OperatorBase, ExportHelper):
     filename_ext = ".csv"
 
     def execute(self, context: Context) -> set[str]:
-        mappings = ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.collection
-        # Each row must be an Iterable whereby each iterated element goes in its own column. MappingCsvLine is a tuple
-        # subclass, so we can turn each mapping into a MappingCsvLine to turn it into a row. Since we use MappingCsvLine
-        # when importing also, this means
-        row_gen = map(MappingCsvLine.from_mapping, mappings)
+        mappings = _get_mapping_group(context).collection
+        # Each row must be an Iterable whereby each iterated element goes in its own column. The columns must be in the
+        # same order as the fields of MappingCsvLine, since that is what is used when importing. Plain tuples are
+        # created rather than MappingCsvLine instances because building a NamedTuple from keyword arguments for every
+        # mapping is comparatively slow.
+        # Note that csv.writer quotes fields containing the delimiter, quote character or newlines, so the fields don't
+        # need any sanitising before being written.
+        # An attrgetter of multiple attributes gets them all as a tuple, without the overhead of a generator expression.
+        # String properties can't be read in bulk with foreach_get, so this is about as fast as reading them gets.
+        row_gen = map(attrgetter('model_shape', 'mmd_name', 'cats_translation_name', 'comment'), mappings)
         # Note: newline should be '' when using csv.writer
-        with open(self.filepath, 'w', encoding='utf-8', newline='') as file:
+        # A larger than default buffer lets most exports be written to the file in a single write
+        with open(self.filepath, 'w', encoding='utf-8', newline='', buffering=_CSV_WRITE_BUFFER_SIZE) as file:
             csv.writer(file).writerows(row_gen)
         return {'FINISHED'}
 
@@ -345,42 +426,68 @@ class ImportShapeSettings(OperatorBase, ImportHelper):
         description="What to do with the existing mappings",
     )
 
-    def execute(self, context: Context) -> set[str]:
-        # Note: newline should be '' when using csv.reader
-        with open(self.filepath, 'r', encoding='utf-8', newline='') as file:
-            reader = csv.reader(file)
-            parsed_lines: Union[list[MappingCsvLine], Generator[MappingCsvLine]] = []
-
-            for line_no, line_list in enumerate(reader, start=1):
-                num_fields = len(line_list)
-                expected_fields = len(MappingCsvLine._fields)
-                if num_fields > expected_fields:
-                    # If there are extra fields, get only as many as we're expecting
-                    parsed_line = MappingCsvLine(*line_list[:expected_fields])
-                else:
-                    # If there aren't enough fields, default values for the missing fields will be used
-                    parsed_line = MappingCsvLine(*line_list)
-
-                parsed_lines.append(parsed_line)
+    def iter_csv_lines(self, file: Iterable[str]) -> Iterator[list[str]]:
+        """Parse each line of a csv file into a list of fields in the order of MappingCsvLine's fields as it is read,
+        reporting any lines that have fewer fields than expected once all lines have been read"""
+        expected_fields = len(MappingCsvLine._fields)
+        # Plain lists are yielded rather than creating a MappingCsvLine for every line because constructing a NamedTuple
+        # from unpacked arguments is comparatively slow
+        field_defaults = tuple(MappingCsvLine._field_defaults[field] for field in MappingCsvLine._fields)
+        # (line number, number of fields) of each line with fewer fields than expected
+        short_lines = []
+        for line_no, line_list in enumerate(csv.reader(file), start=1):
+            num_fields = len(line_list)
+            if num_fields > expected_fields:
+                # If there are extra fields, get only as many as we're expecting
+                yield line_list[:expected_fields]
+            else:
                 if num_fields < expected_fields:
-                    self.report({'WARNING'}, f"Line {line_no} only had {num_fields} fields, (expecting at least"
-                                             f" {expected_fields}).")
-            mappings = ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.collection
+                    short_lines.append((line_no, num_fields))
+                    # If there aren't enough fields, default values for the missing fields will be used
+                    line_list.extend(field_defaults[num_fields:])
+                yield line_list
+        if short_lines:
+            # Report all the short lines together rather than reporting a separate warning for each line
+            lines_text = "\n".join(f"Line {line_no} only had {num_fields} fields"
+                                   for line_no, num_fields in short_lines)
+            self.report({'WARNING'}, f"{len(short_lines)} line(s) had fewer fields than expected (expecting at least"
+                                     f" {expected_fields}):\n{lines_text}")
 
+    def execute(self, context: Context) -> set[str]:
+        mappings = _get_mapping_group(context).collection
+        # Note: newline should be '' when using csv.reader, this also lets csv.reader handle '\r\n' line endings.
+        # 'utf-8-sig' skips the byte order mark that some Windows software, such as Excel, writes at the start of utf-8
+        # csv files. Otherwise, the byte order mark would end up at the start of the first field of the first line.
+        with open(self.filepath, 'r', encoding='utf-8-sig', newline='') as file:
+            # The entire file is parsed before the existing mappings are modified, otherwise a decoding or csv error
+            # partway through the file would leave the existing mappings wiped or only partially imported
+            parsed_lines = list(self.iter_csv_lines(file))
+
+        # MMD names of lines to skip
+        skip_mmd_names: frozenset[str]
+        if self.mode == 'APPEND_NEW':
+            # We don't want to exclude lines that have no mapping, e.g. lines that are only comments
+            skip_mmd_names = _get_existing_values(mappings, 'mmd_name') - {""}
+        else:
             if self.mode == 'REPLACE':
                 mappings.clear()
-            elif self.mode == 'APPEND_NEW':
-                existing_mmd_names = {m.mmd_name for m in mappings}
-                # We don't want to exclude lines that have no mapping, e.g. lines that are only comments
-                existing_mmd_names.remove("")
-                parsed_lines = (p for p in parsed_lines if p.mmd_name not in existing_mmd_names)
-
-            for parsed_line in parsed_lines:
-                added = mappings.add()
-                added.model_shape = parsed_line.model_shape
-                added.mmd_name = parsed_line.mmd_name
-                added.cats_translation_name = parsed_line.cats_translation
-                added.comment = parsed_line.comment
+            skip_mmd_names = frozenset()
+
+        add = mappings.add
+        for model_shape, mmd_name, cats_translation, comment in parsed_lines:
+            if mmd_name in skip_mmd_names:
+                continue
+            added = add()
+            # Newly added mappings already have empty strings for each property, so only non-empty values are set.
+            # Each of the name properties has an update function, so this also skips unnecessary updates.
+            if model_shape:
+                added.model_shape = model_shape
+            if mmd_name:
+                added.mmd_name = mmd_name
+            if cats_translation:
+                added.cats_translation_name = cats_translation
+            if comment:
+                added.comment = comment
         return {'FINISHED'}
 
 
@@ -396,20 +503,21 @@ class ImportPresetMenu(Menu):
     COMMON = "mmd_mappings_common.csv"
     FULL = "mmd_mappings_full.csv"
 
-    RESOURCE_DIR = os.path.join(os.path.dirname(__file__), "resources")
+    RESOURCE_DIR = os.path.join(os.path.dirname(__file__), PRESETS_DIRECTORY)
+
+    # (filepath, text, icon) of each preset, the filepaths only need to be joined once
+    _PRESET_ITEMS = (
+        (os.path.join(RESOURCE_DIR, MOST_COMMON), "Most Common (recommended for basic MMD support", 'SOLO_OFF'),
+        (os.path.join(RESOURCE_DIR, VERY_COMMON), "Common (recommended for more full MMD support)", 'SOLO_ON'),
+        (os.path.join(RESOURCE_DIR, COMMON), "Common + Miku Append + Misc", 'NONE'),
+        (os.path.join(RESOURCE_DIR, FULL), "All (Miku + Akari + Botan + Misc)", 'NONE'),
+    )
 
     def draw(self, context: Context):
         layout = self.layout
         # Don't open the file selection window (invoke), go straight to calling execute
         layout.operator_context = 'EXEC_DEFAULT'
-        file_names_text_and_icon = (
-            (ImportPresetMenu.MOST_COMMON, "Most Common (recommended for basic MMD support", 'SOLO_OFF'),
-            (ImportPresetMenu.VERY_COMMON, "Common (recommended for more full MMD support)", 'SOLO_ON'),
-            (ImportPresetMenu.COMMON, "Common + Miku Append + Misc", 'NONE'),
-            (ImportPresetMenu.FULL, "All (Miku + Akari + Botan + Misc)", 'NONE'),
-        )
-        for file_name, text, icon in file_names_text_and_icon:
-            filepath = os.path.join(ImportPresetMenu.RESOURCE_DIR, file_name)
+        for filepath, text, icon in ImportPresetMenu._PRESET_ITEMS:
             options = layout.operator(ImportShapeSettings.bl_idname, text=text, icon=icon)
             options.mode = 'APPEND'
             options.filepath = filepath
@@ -428,25 +536,23 @@ class CatsTranslateAll(OperatorBase):
         return integration_cats.CatsTranslate.poll(context)
 
     def execute(self, context: Context) -> set[str]:
-        mappings = ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group.collection
+        mappings = _get_mapping_group(context).collection
 
-        # Get all mmd_names that are non-empty and filter out any duplicates
-        unique_to_translate = set()
-        to_translate = []
-        for mapping in mappings:
-            mmd_name = mapping.mmd_name
-            if mmd_name not in unique_to_translate:
-                unique_to_translate.add(mmd_name)
-                to_translate.append(mmd_name)
+        # Read each mmd_name only once, the names are needed again when setting the translations
+        mmd_names = [mapping.mmd_name for mapping in mappings]
+        # Get all mmd_names that are non-empty and filter out any duplicates. dicts preserve insertion order, so
+        # dict.fromkeys filters out duplicates while keeping the order that the names first appear in.
+        to_translate = list(dict.fromkeys(filter(None, mmd_names)))
 
         translations = integration_cats.cats_translate(to_translate, is_shape_key=True, calling_op=self)
         if translations:
-            for mapping in mappings:
-                mmd_name = mapping.mmd_name
-                if mmd_name:
-                    translation = translations.get(mmd_name)
-                    if translation is not None:
-                        mapping.cats_translation_name = translation
+            # Empty mmd_names were never translated, so .get() will return None for them too, meaning there's no need to
+            # check for empty mmd_names separately
+            translations_get = translations.get
+            for mapping, mmd_name in zip(mappings, mmd_names):
+                translation = translations_get(mmd_name)
+                if translation is not None:
+                    mapping.cats_translation_name = translation
         return {'FINISHED'}
 
 
@@ -468,7 +574,7 @@ class MmdShapeMappingsPanel(Panel):
 
     def draw(self, context: Context):
         layout = self.layout
-        group = ScenePropertyGroup.get_group(context.scene).mmd_shape_mapping_group
+        group = _get_mapping_group(context)
 
         col = layout.column()
 
@@ -492,7 +598,9 @@ class MmdShapeMappingsPanel(Panel):
 
         # Draw the list
         row = main_list_col.row()
-        row.template_list(MmdMappingList.bl_idname, "", group, 'collection', group, 'active_index')
+        list_draw_data = _ListDrawData.from_group(group)
+        with _list_draw_data.drawing(group, list_draw_data):
+            row.template_list(MmdMappingList.bl_idname, "", group, 'collection', group, 'active_index')
 
         # Second column for the list controls
         list_controls_col = list_row.column()
@@ -507,8 +615,9 @@ class MmdShapeMappingsPanel(Panel):
         vertical_buttons_col.separator()
         vertical_buttons_col.menu(MmdShapesSpecialsMenu.bl_idname, text="", icon='DOWNARROW_HLT')
         vertical_buttons_col.separator()
-        vertical_buttons_col.operator(MmdMappingMove.bl_idname, text="", icon="TRIA_UP").type = 'UP'
-        vertical_buttons_col.operator(MmdMappingMove.bl_idname, text="", icon="TRIA_DOWN").type = 'DOWN'
+        move_idname = MmdMappingMove.bl_idname
+        vertical_buttons_col.operator(move_idname, text="", icon="TRIA_UP").type = 'UP'
+        vertical_buttons_col.operator(move_idname, text="", icon="TRIA_DOWN").type = 'DOWN'
         vertical_buttons_col.separator()
         vertical_buttons_col.operator(ImportShapeSettings.bl_idname, text="", icon="IMPORT")
         vertical_buttons_col.menu(ImportPresetMenu.bl_idname, text="", icon="PRESET")
@@ -516,7 +625,7 @@ class MmdShapeMappingsPanel(Panel):
         vertical_buttons_col.operator(ExportShapeSettings.bl_idname, text="", icon="EXPORT")
 
         col.operator(CatsTranslateAll.bl_idname, icon="WORLD")
-        if not integration_cats.cats_exists():
+        if not list_draw_data.cats_exists:
             if not OPERATORS_HAVE_POLL_MESSAGES:
                 col.label(text="Cats addon not found")
                 col.label(text="Translating is disabled")
@@ -1,4 +1,4 @@
-from typing import Union, cast, Optional
+from typing import Union, Optional, NamedTuple
 from bpy.types import (
     UIList,
     Context,
@@ -11,9 +11,14 @@ from bpy.types import (
     Menu,
     Scene,
     Action,
+    Key,
 )
 
-from . import shape_key_ops, ui_material_remap, utils, ui_uv_maps, ui_vertex_group_swaps
+from . import utils
+from .shape_key_ops import draw_shape_key_ops
+from .ui_material_remap import KeepOnlyMaterialSlotSearch, draw_material_remap_list
+from .ui_uv_maps import draw_uv_map_list
+from .ui_vertex_group_swaps import draw_vertex_group_swaps
 from .registration import register_module_classes_factory
 from .extensions import (
     ArmatureSettings,
@@ -22,6 +27,7 @@ from .extensions import (
     ModifierSettings,
     ObjectBuildSettings,
     ObjectPropertyGroup,
+    SceneBuildSettings,
     ScenePropertyGroup,
     ShapeKeySettings,
     UVSettings,
@@ -62,7 +68,7 @@ from .version_compatibility import (
 from .registration import OperatorBase
 from .integration_pose_library import is_pose_library_enabled
 from .utils import has_any_enabled_non_armature_modifiers
-from .ui_common import draw_expandable_header
+from .ui_common import draw_expandable_header, UIListDrawData
 
 
 class PickPoseLibraryAsset(OperatorBase):
@@ -126,42 +132,119 @@ class PickPoseLibraryAsset(OperatorBase):
         return {'FINISHED'}
 
 
+class _ListDrawData(NamedTuple):
+    """Data that is the same for every row of a UI list of ObjectBuildSettings"""
+    # Names of all the scene's build settings
+    scene_settings_names: frozenset[str]
+    # Name of the scene's active build settings
+    scene_active_name: str
+
+    @staticmethod
+    def from_scene_group(scene_group: ScenePropertyGroup) -> '_ListDrawData':
+        scene_active = scene_group.active
+        scene_active_name = scene_active.name if scene_active else ""
+        return _ListDrawData(frozenset(scene_group.collection.keys()), scene_active_name)
+
+
+# ObjectPanelBase.draw stores the _ListDrawData of the group it draws so that the data only gets looked up once per
+# redraw instead of once for every row. Otherwise, finding each row's scene settings by name would be O(n^2) per redraw.
+_list_draw_data: UIListDrawData[_ListDrawData] = UIListDrawData()
+
+
 class ObjectBuildSettingsUIList(UIList):
     bl_idname = "object_build_settings"
 
+    # Row icon by (is_scene_active, is_orphaned). The active scene settings always exist, so can't be orphaned
+    _ROW_ICONS = {
+        (True, False): "SCENE_DATA",
+        # Alternatives: "ORPHAN_DATA", "LIBRARY_DATA_BROKEN", "UNLINKED"
+        (False, True): "GHOST_DISABLED",
+        (False, False): "BLANK1",
+    }
+
     def draw_item(self, context: Context, layout: UILayout, data, item: ObjectBuildSettings, icon, active_data, active_property, index=0,
                   flt_flag=0):
-        scene_group = ScenePropertyGroup.get_group(context.scene)
-        scene_settings = scene_group.collection
+        list_draw_data = _list_draw_data.get(data)
+        if list_draw_data is None:
+            # Not being drawn from ObjectPanelBase, so look up the data directly
+            list_draw_data = _ListDrawData.from_scene_group(ScenePropertyGroup.get_group(context.scene))
 
-        scene_active_name = scene_group.active.name
-        is_scene_active = item.name == scene_active_name
+        item_name = item.name
+        is_scene_active = item_name == list_draw_data.scene_active_name
 
-        index_in_scene_settings = scene_settings.find(item.name)
-        is_orphaned = index_in_scene_settings == -1
+        is_orphaned = item_name not in list_draw_data.scene_settings_names
 
         row = layout.row(align=True)
         #row.label(text="", icon="SETTINGS")
-        if is_scene_active:
-            row_icon = "SCENE_DATA"
-        elif is_orphaned:
-            #row_icon = "ORPHAN_DATA"
-            #row_icon = "LIBRARY_DATA_BROKEN"
-            #row_icon = "UNLINKED"
-            row_icon = "GHOST_DISABLED"
-            row.alert = True
+        row_icon = self._ROW_ICONS[is_scene_active, is_orphaned]
+        if is_orphaned:
+            # Only the name is drawn with alert, so it gets its own sub-layout. Rows that aren't orphaned, which are the
+            # common case, draw directly into the row without touching .alert at all
+            name_layout = row.row(align=True)
+            name_layout.alert = True
         else:
-            row_icon = "BLANK1"
+            name_layout = row
         # We could instead display the prop of the scene settings if it exists, which would make changing the name of
         # ObjectBuildSettings also change the name of the connected SceneBuildSettings
         # row.prop(item if is_orphaned else scene_settings[index_in_scene_settings], 'name_prop', text="", emboss=False, icon=row_icon)
-        row.prop(item, 'name_prop', text="", emboss=False, icon=row_icon)
-        row.alert = False
+        name_layout.prop(item, 'name_prop', text="", emboss=False, icon=row_icon)
         row.prop(item, "include_in_build", text="")
         #row.alert = True
         #row.enabled = not is_scene_active
 
 
+def _draw_expandable_header_box(properties_col: UILayout, ui_toggle_data: PropertyGroup, ui_toggle_prop: str,
+                                enabled: bool, copy_type: Optional[CopyPropsItem], text: str, icon: str = 'NONE'):
+    """Draw an expandable header for a section of the Object panel, with an optional menu for copying the section's
+    properties
+    :return: a box UILayout when expanded, otherwise None"""
+    is_expanded, header_row, _sub_row = draw_expandable_header(
+        properties_col, ui_toggle_data, ui_toggle_prop, not enabled, text=text, icon=icon)
+    # Draw menu button for copying properties to other groups or other selected objects
+    if copy_type:
+        # Sub row without align so that the button appears disconnected from the third element
+        menu_row = header_row.row(align=False)
+        menu_row.menu(copy_type.copy_menu.bl_idname, text="", icon="PASTEDOWN")
+
+    if is_expanded:
+        # Create a box that the properties will be drawn in
+        box = properties_col.box()
+        # Add a small gap after the box to help separate it from the next header
+        properties_col.separator()
+        # Create a column within the box for the properties to go in and return it
+        return box.column()
+    else:
+        # The header isn't expanded, so don't return anything for properties to go in
+        return None
+
+
+def _keep_only_material_slot_op_args(obj: Object, slot_index: int) -> tuple[str, dict[str, Union[str, int]], bool]:
+    """Get the text, icon keyword arguments and alert state for the operator button that displays the material slot to
+    keep"""
+    mat_slots = obj.material_slots
+    num_slots = len(mat_slots)
+    if num_slots != 0:
+        if 0 <= slot_index < num_slots:
+            mat = mat_slots[slot_index].material
+            if mat:
+                return mat.name, dict(icon_value=utils.get_preview(mat).icon_id), False
+            else:
+                return "(empty slot)", dict(icon='MATERIAL_DATA'), False
+        else:
+            return "(invalid slot)", dict(icon='ERROR'), True
+    else:
+        # Generally this will never be displayed because the Materials box is only drawn if the mesh's materials list
+        # isn't empty
+        return "(no material slots)", dict(icon='ERROR'), True
+
+
+# Menu for copying all settings of an object type, by object type
+_COPY_ALL_MENUS = {
+    'MESH': COPY_ALL_MESH_SETTINGS.copy_menu,
+    'ARMATURE': COPY_ALL_ARMATURE_SETTINGS.copy_menu,
+}
+
+
 class ObjectPanelBase(Panel):
     @staticmethod
     def _poll_object(obj: Object):
@@ -181,46 +264,31 @@ class ObjectPanelBase(Panel):
     def poll(cls, context: Context):
         return cls._poll_object(cls._get_object(context)) and cls._poll_scene(context.scene)
 
-    @staticmethod
-    def draw_expandable_header(properties_col: UILayout, ui_toggle_data: PropertyGroup, ui_toggle_prop: str,
-                               enabled: bool, copy_type: Optional[CopyPropsItem], **header_args):
-        """Draw an expandable header
-        :return: a box UILayout when expanded, otherwise None"""
-        is_expanded, header_row, _sub_row = draw_expandable_header(
-            properties_col, ui_toggle_data, ui_toggle_prop, not enabled, **header_args)
-        # Draw menu button for copying properties to other groups or other selected objects
-        if copy_type:
-            # Sub row without align so that the button appears disconnected from the third element
-            menu_row = header_row.row(align=False)
-            menu_row.menu(copy_type.copy_menu.bl_idname, text="", icon="PASTEDOWN")
-
-        if is_expanded:
-            # Create a box that the properties will be drawn in
-            box = properties_col.box()
-            # Add a small gap after the box to help separate it from the next header
-            properties_col.separator()
-            # Create a column within the box for the properties to go in and return it
-            return box.column()
-        else:
-            # The header isn't expanded, so don't return anything for properties to go in
-            return None
-
     @staticmethod
     def draw_general_object_box(
+            obj_type: str,
             scene_group: ScenePropertyGroup,
-            obj: Object,
+            synced_scene_settings: Optional[SceneBuildSettings],
             properties_col: UILayout,
             settings: ObjectBuildSettings,
             ui_toggle_data: WmObjectToggles,
             enabled: bool
     ):
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'general', enabled,
-                                                 COPY_GENERAL_OBJECT_SETTINGS, text="Object", icon='OBJECT_DATA')
+        """Draw the general object settings box
+        :param synced_scene_settings: The active scene settings when sync is enabled, otherwise None, in which case the
+        scene settings with the same name as settings are looked up from scene_group, but only if they're needed."""
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'general', enabled,
+                                          COPY_GENERAL_OBJECT_SETTINGS, text="Object", icon='OBJECT_DATA')
         if box:
             box.prop(settings.general_settings, 'target_object_name')
             box.prop(settings.general_settings, 'join_order')
-            if obj.type == 'MESH':
-                scene_settings = scene_group.collection.get(settings.name)
+            # The scene settings are currently only needed for meshes
+            if obj_type == 'MESH':
+                if synced_scene_settings is not None:
+                    scene_settings = synced_scene_settings
+                else:
+                    # Will be None if settings are orphaned
+                    scene_settings = scene_group.collection.get(settings.name)
                 # Only enable ignore_reduce_to_two_meshes if the ObjectBuildSettings are orphaned from scene settings
                 # or the scene settings has reduce_to_two_meshes enabled
                 sub = box.column()
@@ -229,8 +297,8 @@ class ObjectPanelBase(Panel):
 
     def draw_armature_box(self, context: Context, properties_col: UILayout, settings: ArmatureSettings, obj: Object,
                           ui_toggle_data: WmArmatureToggles, enabled: bool):
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'pose', enabled,
-                                                 COPY_ARMATURE_POSE_SETTINGS, text="Pose", icon='ARMATURE_DATA')
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'pose', enabled,
+                                          COPY_ARMATURE_POSE_SETTINGS, text="Pose", icon='ARMATURE_DATA')
         if box:
             export_pose = settings.armature_export_pose
 
@@ -268,9 +336,9 @@ class ObjectPanelBase(Panel):
                     else:
                         pose_asset_disabled_col.prop(pose_asset_settings, 'external_action_name', icon='ACTION')
                         pose_asset_disabled_col.prop(pose_asset_settings, 'external_action_file_display', icon='BLENDER')
-                    asset_picker_box = ObjectPanel.draw_expandable_header(armature_pose_custom_col,
-                                                                          ui_toggle_data, 'pose_asset_picker',
-                                                                          enabled, None, text="Asset Picker")
+                    asset_picker_box = _draw_expandable_header_box(armature_pose_custom_col,
+                                                                   ui_toggle_data, 'pose_asset_picker',
+                                                                   enabled, None, text="Asset Picker")
                     if asset_picker_box:
                         if isinstance(self, ObjectPanel):
                             # Selecting Assets is annoying because the preview and text can only be clicked on when the
@@ -309,41 +377,41 @@ class ObjectPanelBase(Panel):
     @staticmethod
     def draw_vertex_groups_box(properties_col: UILayout, settings: VertexGroupSettings, ui_toggle_data: WmMeshToggles,
                                enabled: bool):
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'vertex_groups', enabled,
-                                                 COPY_MESH_VERTEX_GROUPS_SETTINGS, text="Vertex Groups",
-                                                 icon='GROUP_VERTEX')
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'vertex_groups', enabled,
+                                          COPY_MESH_VERTEX_GROUPS_SETTINGS, text="Vertex Groups",
+                                          icon='GROUP_VERTEX')
         if box:
-            ui_vertex_group_swaps.draw_vertex_group_swaps(box, settings.vertex_group_swaps)
+            draw_vertex_group_swaps(box, settings.vertex_group_swaps)
             box.prop(settings, 'remove_non_deform_vertex_groups')
 
     @staticmethod
     def draw_vertex_colors_box(properties_col: UILayout, settings: VertexColorSettings, ui_toggle_data: WmMeshToggles,
                                enabled: bool):
         text = "Color Attributes" if MESH_HAS_COLOR_ATTRIBUTES else "Vertex Colors"
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'vertex_colors', enabled,
-                                                 COPY_MESH_VERTEX_GROUPS_SETTINGS, text=text,
-                                                 icon='GROUP_VCOL')
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'vertex_colors', enabled,
+                                          COPY_MESH_VERTEX_GROUPS_SETTINGS, text=text,
+                                          icon='GROUP_VCOL')
         if box:
             box.prop(settings, 'remove_vertex_colors')
 
     @staticmethod
-    def draw_shape_keys_box(properties_col: UILayout, settings: ShapeKeySettings, me: Mesh,
+    def draw_shape_keys_box(properties_col: UILayout, settings: ShapeKeySettings, shape_keys: Key,
                             ui_toggle_data: WmMeshToggles, enabled: bool):
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'shape_keys', enabled,
-                                                 COPY_MESH_SHAPE_KEYS_SETTINGS, text="Shape keys", icon='SHAPEKEY_DATA')
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'shape_keys', enabled,
+                                          COPY_MESH_SHAPE_KEYS_SETTINGS, text="Shape keys", icon='SHAPEKEY_DATA')
         if box:
             main_op_col = box.column()
             main_op_col.prop(settings, 'shape_keys_main_op')
 
             main_op = settings.shape_keys_main_op
             if main_op == 'CUSTOM':
-                shape_key_ops.draw_shape_key_ops(box, settings, me.shape_keys)
+                draw_shape_key_ops(box, settings, shape_keys)
 
     @staticmethod
     def draw_mesh_modifiers_box(properties_col: UILayout, settings: ModifierSettings, ui_toggle_data: WmMeshToggles,
                                 enabled: bool):
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'modifiers', enabled,
-                                                 COPY_MESH_MODIFIERS_SETTINGS, text="Modifiers", icon='MODIFIER_DATA')
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'modifiers', enabled,
+                                          COPY_MESH_MODIFIERS_SETTINGS, text="Modifiers", icon='MODIFIER_DATA')
         if box:
             if settings.apply_non_armature_modifiers == 'APPLY_KEEP_SHAPES_GRET':
                 gret_available = check_gret_shape_key_apply_modifiers()
@@ -366,33 +434,30 @@ class ObjectPanelBase(Panel):
     @staticmethod
     def draw_uv_layers_box(properties_col: UILayout, settings: UVSettings, me: Mesh, ui_toggle_data: WmMeshToggles,
                            enabled: bool):
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'uv_layers', enabled,
-                                                 COPY_MESH_UV_LAYERS_SETTINGS, text="UV Layers", icon='GROUP_UVS')
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'uv_layers', enabled,
+                                          COPY_MESH_UV_LAYERS_SETTINGS, text="UV Layers", icon='GROUP_UVS')
         if box:
             box.prop(settings, 'uv_maps_to_keep')
-            # Guaranteed to not be empty because we only call this function when it's non-empty
-            uv_layers = me.uv_layers
             uv_maps_to_keep = settings.uv_maps_to_keep
             if uv_maps_to_keep == 'FIRST':
-                box.prop(uv_layers[0], 'name', emboss=False)
+                # Guaranteed to not be empty because we only call this function when it's non-empty
+                box.prop(me.uv_layers[0], 'name', emboss=False)
             elif uv_maps_to_keep == 'SINGLE':
                 box.prop_search(settings, 'keep_only_uv_map', me, 'uv_layers', icon="GROUP_UVS")
             elif uv_maps_to_keep == 'LIST':
-                ui_uv_maps.draw_uv_map_list(box, settings.keep_uv_map_list)
+                draw_uv_map_list(box, settings.keep_uv_map_list)
 
     @staticmethod
     def draw_materials_box(properties_col: UILayout, settings: MaterialSettings, obj: Object,
                            ui_toggle_data: WmMeshToggles, enabled: bool):
-        box = ObjectPanel.draw_expandable_header(properties_col, ui_toggle_data, 'materials', enabled,
-                                                 COPY_MESH_MATERIALS_SETTINGS, text="Materials", icon='MATERIAL_DATA')
+        box = _draw_expandable_header_box(properties_col, ui_toggle_data, 'materials', enabled,
+                                          COPY_MESH_MATERIALS_SETTINGS, text="Materials", icon='MATERIAL_DATA')
         if box:
             box.prop(settings, 'materials_main_op')
 
             main_op = settings.materials_main_op
             if main_op == 'KEEP_SINGLE':
-                slot_index = settings.keep_only_mat_slot
-                mat_slots = obj.material_slots
-                num_slots = len(mat_slots)
+                text, icon_args, is_alert = _keep_only_material_slot_op_args(obj, settings.keep_only_mat_slot)
                 # 0.4 split with a label in the first part of the split and an operator in the second part of the split
                 # seems to match properties with non-empty text displayed with UILayout.use_property_split
                 split = box.split(factor=0.4, align=True)
@@ -402,25 +467,8 @@ class ObjectPanelBase(Panel):
                 # For some reason .alert causes .alignment to be ignored, so we have to put the operator in a
                 # sub-layout, so we can set .alert on that instead
                 sub = split.row()
-                if num_slots != 0:
-                    if 0 <= slot_index < num_slots:
-                        mat = mat_slots[slot_index].material
-                        if mat:
-                            sub.operator(ui_material_remap.KeepOnlyMaterialSlotSearch.bl_idname, text=mat.name,
-                                         icon_value=utils.get_preview(mat).icon_id)
-                        else:
-                            sub.operator(ui_material_remap.KeepOnlyMaterialSlotSearch.bl_idname, text="(empty slot)",
-                                         icon='MATERIAL_DATA')
-                    else:
-                        sub.alert = True
-                        sub.operator(ui_material_remap.KeepOnlyMaterialSlotSearch.bl_idname, text="(invalid slot)",
-                                     icon='ERROR')
-                else:
-                    # Generally this will never be displayed because the Materials box is only drawn if the mesh's materials
-                    # list isn't empty
-                    sub.alert = True
-                    sub.operator(ui_material_remap.KeepOnlyMaterialSlotSearch.bl_idname, text="(no material slots)",
-                                 icon='ERROR')
+                sub.alert = is_alert
+                sub.operator(KeepOnlyMaterialSlotSearch.bl_idname, text=text, **icon_args)
             elif main_op == 'REMAP_SINGLE':
                 mat = settings.remap_single_material
                 if mat:
@@ -428,11 +476,11 @@ class ObjectPanelBase(Panel):
                 else:
                     box.prop(settings, 'remap_single_material')
             elif main_op == 'REMAP':
-                ui_material_remap.draw_material_remap_list(box, obj, settings.materials_remap)
+                draw_material_remap_list(box, obj, settings.materials_remap)
 
     def draw_mesh_boxes(self, properties_col: UILayout, settings: MeshSettings, obj: Object,
                         ui_toggle_data: WmMeshToggles, enabled: bool):
-        me = cast(Mesh, obj.data)
+        me: Mesh = obj.data
 
         # Draw each section in the order that they get applied in build_mesh in op_build_avatar
 
@@ -440,8 +488,9 @@ class ObjectPanelBase(Panel):
         # reference key, the 'Basis'.
         # Note that non-relative shape keys are not supported at this time
         # TODO: Find out if (and if so, how) Blender's FBX exporter supports non-relative shape keys
-        if me.shape_keys and len(me.shape_keys.key_blocks) > 1:
-            self.draw_shape_keys_box(properties_col, settings.shape_key_settings, me, ui_toggle_data, enabled)
+        shape_keys = me.shape_keys
+        if shape_keys and len(shape_keys.key_blocks) > 1:
+            self.draw_shape_keys_box(properties_col, settings.shape_key_settings, shape_keys, ui_toggle_data, enabled)
 
         # We don't touch armature modifiers, so only include the modifiers box when there's at least one non-armature
         # modifier
@@ -470,19 +519,15 @@ class ObjectPanelBase(Panel):
         layout = self.layout
         main_column = layout.column(align=True)
         main_col = main_column.column()
-        # Sync setting and anything else that should be before things
+        # Sync setting and anything else that should be before things. These are drawn directly into main_col since a
+        # nested, unaligned column would look no different.
+        main_col.use_property_decorate = True
 
-        header_col = main_col.column()
-        header_col.use_property_decorate = True
-
-        header_top_row = header_col.row(align=True)
+        header_top_row = main_col.row(align=True)
         header_top_row.use_property_decorate = False
 
-        copy_menu = None
-        if obj.type == 'MESH':
-            copy_menu = COPY_ALL_MESH_SETTINGS.copy_menu
-        elif obj.type == 'ARMATURE':
-            copy_menu = COPY_ALL_ARMATURE_SETTINGS.copy_menu
+        obj_type = obj.type
+        copy_menu = _COPY_ALL_MENUS.get(obj_type)
 
         scene_group = ScenePropertyGroup.get_group(context.scene)
         is_synced = object_ui_sync_enabled(context)
@@ -511,10 +556,10 @@ class ObjectPanelBase(Panel):
                 if scene_group.collection:
                     # Only happens if the active index is out of bounds for some reason, since we hide the panel
                     # when there are no Build Settings
-                    header_col.label(text="Active build settings is out of bounds, this shouldn't normally happen.")
-                    header_col.label(text="Select one in the list in the 3D View or Auto Fix")
+                    main_col.label(text="Active build settings is out of bounds, this shouldn't normally happen.")
+                    main_col.label(text="Select one in the list in the 3D View or Auto Fix")
                     # Button to set the active index to 0
-                    options = header_col.operator('wm.context_set_int', text="Auto Fix", icon='SHADERFX')
+                    options = main_col.operator('wm.context_set_int', text="Auto Fix", icon='SHADERFX')
                     options.data_path = 'scene.' + scene_group.path_from_id('active_index')
                     options.value = 0
                     options.relative = False
@@ -530,7 +575,9 @@ class ObjectPanelBase(Panel):
                 header_top_row.menu(copy_menu.bl_idname, text="", icon='PASTEDOWN')
 
             list_row = header_top_row.row(align=False)
-            list_row.template_list(ObjectBuildSettingsUIList.bl_idname, "", group, 'collection', group, 'active_index', rows=3)
+            with _list_draw_data.drawing(group, _ListDrawData.from_scene_group(scene_group)):
+                list_row.template_list(ObjectBuildSettingsUIList.bl_idname, "", group, 'collection', group,
+                                       'active_index', rows=3)
             vertical_buttons_col = header_top_row.column(align=True)
             vertical_buttons_col.menu(ObjectBuildSettingsAddMenu.bl_idname, text="", icon="ADD")
             vertical_buttons_col.operator(ObjectBuildSettingsRemove.bl_idname, text="", icon="REMOVE")
@@ -539,8 +586,9 @@ class ObjectPanelBase(Panel):
             vertical_buttons_col.operator(ObjectBuildSettingsMove.bl_idname, text="", icon="TRIA_DOWN").type = 'DOWN'
 
         if active_object_settings:
+            settings_enabled = active_object_settings.include_in_build
             # Extra col for label when disabled
-            if not active_object_settings.include_in_build:
+            if not settings_enabled:
                 disabled_label_col = main_col.column()
                 disabled_label_col.alignment = 'RIGHT'
                 disabled_label_col.use_property_split = True
@@ -553,23 +601,26 @@ class ObjectPanelBase(Panel):
                 main_col.separator()
 
             # Display the properties for the active settings
-            settings_enabled = active_object_settings.include_in_build
             properties_col = main_column.column()
             properties_col.use_property_split = True
             properties_col.use_property_decorate = False
 
             toggles = WindowManagerPropertyGroup.get_group(context.window_manager).ui_toggles.object
 
+            # When synced, the active object settings were found by the name of the active scene settings, so there's
+            # no need to look the scene settings up
+            synced_scene_settings = active_build_settings if is_synced else None
+
             # Display the box for general object settings
-            self.draw_general_object_box(
-                scene_group, obj, properties_col, active_object_settings, toggles, settings_enabled)
+            self.draw_general_object_box(obj_type, scene_group, synced_scene_settings, properties_col,
+                                         active_object_settings, toggles, settings_enabled)
 
             # Display the box for armature settings if the object is an armature
-            if obj.type == 'ARMATURE':
+            if obj_type == 'ARMATURE':
                 self.draw_armature_box(context, properties_col, active_object_settings.armature_settings, obj,
                                        toggles.armature, settings_enabled)
             # Display the boxes for mesh settings if the object is a mesh
-            elif obj.type == 'MESH':
+            elif obj_type == 'MESH':
                 mesh_settings = active_object_settings.mesh_settings
                 self.draw_mesh_boxes(properties_col, mesh_settings, obj, toggles.mesh, settings_enabled)
 
@@ -593,14 +644,12 @@ class ObjectPanel(ObjectPanelBase):
 
     @staticmethod
     def _get_object(context: Context):
-        # guaranteed to be SpaceProperties by the bl_space_type
-        space_data = cast(SpaceProperties, context.space_data)
-        pin_id = space_data.pin_id
-        if pin_id:
-            # poll function has already checked that there's either no pin or that it's an object
-            return pin_id
-        else:
-            return context.object
+        # guaranteed to be SpaceProperties by the bl_space_type. An annotation is used instead of typing.cast to avoid a
+        # function call on every draw
+        space_data: SpaceProperties = context.space_data
+        # Usually there is no pin, in which case context.object is used. poll function has already checked that there's
+        # either no pin or that it's an object
+        return space_data.pin_id or context.object
 
 
 class ObjectPanelView3D(ObjectPanelBase):
@@ -650,6 +699,23 @@ class ObjectBuildSettingsBase(ContextCollectionOperatorBase):
         else:
             object_group.active_index = value
 
+    @classmethod
+    def active_index_in_bounds(cls, context: Context):
+        # Operator polls call this when drawing the operators' buttons, so get the group and check whether sync is
+        # enabled only once, instead of separately in both get_collection and get_active_index
+        object_group = cls.get_object_group(context)
+        collection = object_group.collection
+        if object_ui_sync_enabled(context):
+            active_scene_settings = ScenePropertyGroup.get_group(context.scene).active
+            if active_scene_settings:
+                active_name = active_scene_settings.name
+                # The synced active index is in bounds when the collection contains settings with the same name
+                return bool(active_name) and active_name in collection
+            else:
+                return False
+        else:
+            return cls.index_in_bounds(collection, object_group.active_index)
+
 
 _op_builder = ObjectBuildSettingsBase.op_builder(
     class_name_prefix='ObjectBuildSettings',
@@ -667,7 +733,13 @@ class ObjectBuildSettingsAdd(ObjectBuildSettingsBase, CollectionAddBase[ObjectBu
     @staticmethod
     def set_new_item_name_static(data: PropCollectionType, added: ObjectBuildSettings, name=None):
         if name:
-            added.name_prop = name
+            if name in data:
+                # Assigning the prop will rename the existing settings with the same name, so that the names stay unique
+                added.name_prop = name
+            else:
+                # The name is already unique, so skip the prop's update function, which has to get the names of the
+                # settings in every scene
+                added.set_name_no_propagate(name)
         # Auto name
         else:
             # Rename if not unique and ensure that the internal name is also set
@@ -683,17 +755,17 @@ class ObjectBuildSettingsAdd(ObjectBuildSettingsBase, CollectionAddBase[ObjectBu
         self.set_new_item_name_static(data, added, self.name)
 
     def execute(self, context: Context) -> set[str]:
-        obj = context.object
-        object_group = ObjectPropertyGroup.get_group(obj)
         sync_enabled = object_ui_sync_enabled(context)
         if sync_enabled:
-            synced_active_index = self.get_active_index(context)
-            if synced_active_index == -1:
+            # Check the active SceneSettings directly, rather than through self.get_active_index, which would check
+            # whether sync is enabled again
+            active_build_settings = ScenePropertyGroup.get_group(context.scene).active
+            active_name = active_build_settings.name if active_build_settings else None
+            if active_name and active_name not in self.get_collection(context):
                 # ObjectSettings for the currently active SceneSettings don't exist
-                active_build_settings = ScenePropertyGroup.get_group(context.scene).active
-                self.name = active_build_settings.name
+                self.name = active_name
             else:
-                # There is no currently active Scene settings
+                # There is no currently active Scene settings or the ObjectSettings for them already exist
                 return {'CANCELLED'}
         return super().execute(context)
 
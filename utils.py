@@ -124,8 +124,13 @@ def temp_view_layer(scene: Scene) -> ViewLayer:
         scene.view_layers.remove(temp)
 
 
+# get_preview is called for every material drawn with its preview icon on every redraw, so only compare the Blender
+# version once
+_HAS_PREVIEW_ENSURE = bpy.app.version >= (3, 0)
+
+
 def get_preview(id: ID) -> ImagePreview:
-    if bpy.app.version >= (3, 0):
+    if _HAS_PREVIEW_ENSURE:
         # .preview can be None in 3.0+, the new preview_ensure() method can be used.
         # noinspection PyUnresolvedReferences
         preview = id.preview_ensure()
@@ -276,8 +281,14 @@ def get_unique_name(base_name: str, existing_names_or_collection: Union[Iterable
         # keys, an Object's vertex groups and bpy.data.objects)
         if len(existing_names_or_collection) > 1024:
             existing_names_set = set(existing_names_or_collection.keys())
+        elif base_name not in existing_names_or_collection:
+            # The common case where base_name is already unique
+            return base_name
         else:
-            existing_names_set = existing_names_or_collection
+            # At least one more check will be needed, and each further check against the collection would cost about
+            # the same as creating the set, so create the set now. This keeps finding a unique name linear in the size
+            # of the collection, even when many numbered names already exist
+            existing_names_set = set(existing_names_or_collection.keys())
     elif isinstance(existing_names_or_collection, set):
         existing_names_set = existing_names_or_collection
     else: